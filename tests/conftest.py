@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Share a single TestClient so app lifespan runs once per session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """Async client for tests that issue independent requests concurrently"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    """Restore each activity's participants after the test"""
+    snapshot = {name: list(activity["participants"])
+                for name, activity in activities.items()}
+    yield
+    for name, participants in snapshot.items():
+        activities[name]["participants"][:] = participants
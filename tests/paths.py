@@ -0,0 +1,10 @@
+"""
+URL-encoded activity endpoint paths shared by the API tests
+"""
+
+CHESS_SIGNUP = "/activities/Chess%20Club/signup"
+CHESS_SIGNOFF = "/activities/Chess%20Club/signoff"
+BASKETBALL_SIGNUP = "/activities/Basketball%20Team/signup"
+BASKETBALL_SIGNOFF = "/activities/Basketball%20Team/signoff"
+NONEXISTENT_SIGNUP = "/activities/Nonexistent%20Activity/signup"
+NONEXISTENT_SIGNOFF = "/activities/Nonexistent%20Activity/signoff"
@@ -0,0 +1,42 @@
+"""
+Tests for multi-step signup and signoff flows in the Mergington High School Activities API
+"""
+
+import asyncio
+
+import pytest
+
+from app import activities
+from tests.paths import BASKETBALL_SIGNOFF, BASKETBALL_SIGNUP, CHESS_SIGNUP
+
+
+def test_multiple_signups_and_signoffs(client):
+    """Test multiple signup and signoff operations"""
+    # Sign up a new student
+    response1 = client.post(f"{BASKETBALL_SIGNUP}?email=newplayer@mergington.edu")
+    assert response1.status_code == 200
+    
+    # Sign them off
+    response2 = client.post(f"{BASKETBALL_SIGNOFF}?email=newplayer@mergington.edu")
+    assert response2.status_code == 200
+    
+    # Verify they're removed
+    assert "newplayer@mergington.edu" not in activities["Basketball Team"]["participants"]
+
+
+@pytest.mark.anyio
+async def test_signup_multiple_activities(aclient):
+    """Test a student signing up for multiple activities"""
+    student_email = "multiactivity@mergington.edu"
+    
+    # Sign up for Chess Club and Basketball Team concurrently
+    response1, response2 = await asyncio.gather(
+        aclient.post(f"{CHESS_SIGNUP}?email={student_email}"),
+        aclient.post(f"{BASKETBALL_SIGNUP}?email={student_email}"),
+    )
+    assert response1.status_code == 200
+    assert response2.status_code == 200
+    
+    # Verify student is in both activities
+    assert student_email in activities["Chess Club"]["participants"]
+    assert student_email in activities["Basketball Team"]["participants"]
@@ -0,0 +1,45 @@
+"""
+Tests for reading activities from the Mergington High School Activities API
+"""
+
+import pytest
+
+from app import activities, get_activities
+
+
+class TestReadOnly:
+    """Tests that never mutate activities"""
+
+    @pytest.fixture
+    def reset_activities(self):
+        """Override the autouse per-test reset; these tests have nothing to undo"""
+        yield
+
+    def test_root_redirect(self, client):
+        """Test that root redirects to static/index.html"""
+        response = client.get("/", follow_redirects=True)
+        assert response.status_code == 200
+
+    def test_get_activities(self, client):
+        """Test the activities endpoint over HTTP"""
+        response = client.get("/activities")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert isinstance(data, dict)
+        assert data == activities
+
+    def test_get_activities_handler(self):
+        """Test getting all activities"""
+        data = get_activities()
+        assert isinstance(data, dict)
+        assert "Chess Club" in data
+        assert "Basketball Team" in data
+        assert len(data) == 9
+        
+        # Verify activity structure
+        chess = data["Chess Club"]
+        assert chess["description"] == "Learn strategies and compete in chess tournaments"
+        assert chess["schedule"] == "Fridays, 3:30 PM - 5:00 PM"
+        assert chess["max_participants"] == 12
+        assert "michael@mergington.edu" in chess["participants"]
@@ -0,0 +1,37 @@
+"""
+Tests for signing off from activities in the Mergington High School Activities API
+"""
+
+import pytest
+
+from app import activities
+from tests.paths import CHESS_SIGNOFF, NONEXISTENT_SIGNOFF
+
+
+def test_signoff_from_activity(client):
+    """Test removing a student from an activity"""
+    response = client.post(f"{CHESS_SIGNOFF}?email=michael@mergington.edu")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert "Removed" in data["message"]
+    assert "michael@mergington.edu" in data["message"]
+    
+    # Verify the student was removed
+    assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
+
+
+@pytest.mark.parametrize("path,email,status_code,detail", [
+    (CHESS_SIGNOFF, "notregistered@mergington.edu", 400, "not signed up"),
+    (NONEXISTENT_SIGNOFF, "test@mergington.edu", 404, "not found"),
+], ids=[
+    "not-registered",
+    "nonexistent-activity",
+])
+def test_signoff_error_paths(client, path, email, status_code, detail):
+    """Test that invalid signoffs are rejected"""
+    response = client.post(f"{path}?email={email}")
+    
+    assert response.status_code == status_code
+    data = response.json()
+    assert detail in data["detail"]
@@ -0,0 +1,37 @@
+"""
+Tests for signing up for activities in the Mergington High School Activities API
+"""
+
+import pytest
+
+from app import activities
+from tests.paths import CHESS_SIGNUP, NONEXISTENT_SIGNUP
+
+
+def test_signup_for_activity(client):
+    """Test signing up a student for an activity"""
+    response = client.post(f"{CHESS_SIGNUP}?email=newstudent@mergington.edu")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert "Signed up" in data["message"]
+    assert "newstudent@mergington.edu" in data["message"]
+    
+    # Verify the student was added
+    assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
+
+
+@pytest.mark.parametrize("path,email,status_code,detail", [
+    (CHESS_SIGNUP, "michael@mergington.edu", 400, "already signed up"),
+    (NONEXISTENT_SIGNUP, "test@mergington.edu", 404, "not found"),
+], ids=[
+    "duplicate-email",
+    "nonexistent-activity",
+])
+def test_signup_error_paths(client, path, email, status_code, detail):
+    """Test that invalid signups are rejected"""
+    response = client.post(f"{path}?email={email}")
+    
+    assert response.status_code == status_code
+    data = response.json()
+    assert detail in data["detail"]